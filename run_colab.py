@@ -4,7 +4,7 @@ Script simplificado para ejecutar en Google Colab
 """
 
 import sys
-import os
+import zipfile
 
 # Añadir src al path
 sys.path.insert(0, '/content/ab_newyork_etl/src')
@@ -28,8 +28,13 @@ def run_in_colab():
     print("=" * 60)
     print(f"Archivo fuente: {zip_path}")
     
-    # Verificar que el archivo existe
-    if not os.path.exists(zip_path):
+    # Crear pipeline
+    pipeline = NYC_Airbnb_ETL()
+    
+    # Verificar que el archivo existe (abre el ZIP una sola vez)
+    try:
+        info = pipeline.preflight(zip_path)
+    except FileNotFoundError:
         print(f"\n❌ Error: El archivo no existe: {zip_path}")
         print("\n💡 Soluciones:")
         print("1. Monta Google Drive:")
@@ -38,13 +43,13 @@ def run_in_colab():
         print("\n2. Verifica la ruta correcta:")
         print("   !ls /content/drive/MyDrive/Datasets/")
         return
+    except zipfile.BadZipFile as e:
+        print(f"\n❌ Error: El archivo no es un ZIP válido: {e}")
+        return
     
-    print(f"✅ Archivo encontrado ({os.path.getsize(zip_path)/1024/1024:.2f} MB)")
+    print(f"✅ Archivo encontrado ({info['size_mb']:.2f} MB)")
     
     try:
-        # Crear pipeline
-        pipeline = NYC_Airbnb_ETL()
-        
         # Ejecutar
         print("\n🚀 Iniciando procesamiento...")
         data = pipeline.run(zip_path)
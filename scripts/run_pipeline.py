@@ -4,7 +4,8 @@ Script to run the ETL pipeline
 """
 import sys
 import os
-import subprocess
+import itertools
+import zipfile
 from pathlib import Path
 
 # Add src to path
@@ -12,22 +13,27 @@ current_dir = Path(__file__).parent
 src_dir = current_dir.parent / "src"
 sys.path.insert(0, str(src_dir))
 
+def _iter_zip(root):
+    """Recursively yield paths of ZIP files under root"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_zip(entry.path)
+            elif entry.name.endswith('.zip') and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
 def search_zip_files():
     """Search for ZIP files in Google Drive"""
     print("\n📂 Searching Google Drive...")
     try:
-        # Use subprocess to run shell commands
-        result = subprocess.run(
-            ['find', '/content/drive/MyDrive', '-name', '*.zip', '-type', 'f'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0 and result.stdout:
-            files = result.stdout.strip().split('\n')
-            for file in files[:10]:  # Show only first 10
-                if file:
-                    print(f"  • {file}")
+        files = list(itertools.islice(_iter_zip('/content/drive/MyDrive'), 10))  # Show only first 10
+        if files:
+            for file in files:
+                print(f"  • {file}")
         else:
             print("  No ZIP files found")
     except Exception as e:
@@ -53,16 +59,21 @@ def main():
     zip_path = "/content/drive/MyDrive/Datasets/ab_newyork.zip"
     print(f"\n🔍 Searching for: {zip_path}")
     
-    if not os.path.exists(zip_path):
+    pipeline = NYC_Airbnb_ETL()
+    try:
+        info = pipeline.preflight(zip_path)
+    except FileNotFoundError:
         print(f"❌ ERROR: File not found")
         search_zip_files()
         sys.exit(1)
+    except zipfile.BadZipFile as e:
+        print(f"❌ ERROR: Not a valid ZIP file: {e}")
+        sys.exit(1)
     
-    print(f"✅ File found ({os.path.getsize(zip_path)/1024/1024:.2f} MB)")
+    print(f"✅ File found ({info['size_mb']:.2f} MB)")
     print("\n🚀 Running pipeline...")
     
     try:
-        pipeline = NYC_Airbnb_ETL()
         data, csv_path, parquet_path = pipeline.run(zip_path)
         
         print("\n" + "="*60)
@@ -2,27 +2,362 @@
 Extraction module for NYC Airbnb data
 """
 import pandas as pd
+import numpy as np
+import hashlib
+import io
+import json
 import zipfile
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, List, Callable
 import logging
 from loguru import logger
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
+    from pyarrow import feather
+except ImportError:  # pragma: no cover - pyarrow is optional for extraction
+    pa = None
+    pq = None
+    pa_csv = None
+    feather = None
+
 class DataExtractor:
     """Handles data extraction from various sources"""
     
+    # Shared ZIP handles: path -> (mtime_ns, ZipFile), most recent last
+    _zip_handles: "OrderedDict[str, Any]" = OrderedDict()
+    _ZIP_HANDLE_LIMIT = 4
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.raw_path = Path(config['paths']['raw_data'])
         self.raw_path.mkdir(parents=True, exist_ok=True)
+        self._readers = {
+            'zip': self.extract_from_zip,
+            'csv': self.extract_from_csv,
+            'parquet': self.extract_from_parquet,
+            'feather': self.extract_from_feather
+        }
+    
+    def _schema_path(self, name: str) -> Optional[Path]:
+        """Location of the cached dtype schema for a CSV file name"""
+        schema_dir = self.config['extraction'].get('schema_dir')
+        if not schema_dir:
+            return None
+        digest = hashlib.sha1(name.encode('utf-8')).hexdigest()[:16]
+        return Path(schema_dir) / f"schema_{digest}.json"
+    
+    @staticmethod
+    def _source_version(source: Any) -> Optional[str]:
+        """Size and mtime of a CSV path, None for file-like sources"""
+        if isinstance(source, (str, os.PathLike)):
+            st = os.stat(source)
+            return f"{st.st_size}-{st.st_mtime_ns}"
+        return None
+    
+    def _load_schema(self, name: str, version: Optional[str]) -> Optional[Dict[str, str]]:
+        """
+        Load the cached dtype schema for a CSV file
+        
+        Args:
+            name: CSV file name the schema is keyed by
+            version: Size/mtime (or size/CRC for ZIP members) of the file;
+                a schema cached for another version is ignored
+            
+        Returns:
+            Mapping of column name to dtype string, or None if not cached
+        """
+        schema_path = self._schema_path(name)
+        if schema_path is None or version is None:
+            return None
+        
+        try:
+            with open(schema_path, 'r') as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('version') != version:
+            return None
+        return cached.get('dtypes')
+    
+    def _save_schema(self, name: str, version: Optional[str], df: pd.DataFrame) -> None:
+        """Persist the dtypes inferred for a version of a CSV file"""
+        schema_path = self._schema_path(name)
+        if schema_path is None or version is None:
+            return
+        
+        schema_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(schema_path, 'w') as f:
+            json.dump({'version': version, 'dtypes': df.dtypes.astype(str).to_dict()}, f, indent=2)
+        logger.info(f"Saved dtype schema for {name} to {schema_path}")
+    
+    @staticmethod
+    def _rewind(source: Any) -> None:
+        """Seek a file-like source back to the start before a re-read"""
+        if hasattr(source, 'seek'):
+            source.seek(0)
+    
+    @staticmethod
+    def _arrow_type(dtype: str) -> Optional[Any]:
+        """Map a pandas dtype string to an Arrow type, None to let Arrow infer"""
+        if dtype.startswith('datetime64'):
+            return pa.timestamp('ns')
+        if dtype == 'category':
+            return pa.dictionary(pa.int32(), pa.string())
+        if dtype in ('str', 'string'):
+            return pa.string()
+        try:
+            return pa.from_numpy_dtype(np.dtype(dtype))
+        except (TypeError, pa.ArrowNotImplementedError):
+            return None
+    
+    def _read_table(self, source: Union[str, Path], name: Optional[str] = None, 
+                    schema: Optional[Dict[str, str]] = None, version: Optional[str] = None,
+                    **read_kwargs) -> "pa.Table":
+        """
+        Parse a CSV source into an Arrow table
+        
+        Args:
+            source: Path or file-like object with CSV data
+            name: CSV file name used to look up the cached dtype schema
+            schema: Already loaded dtype schema, takes precedence over name
+            version: Version of the source for the schema lookup, defaults
+                to the size/mtime of a path
+            **read_kwargs: pandas-only options, ignored by the Arrow reader
+            
+        Returns:
+            Parsed Arrow table
+        """
+        if schema is None and name:
+            schema = self._load_schema(name, version or self._source_version(source))
+            if schema:
+                try:
+                    return self._read_table(source, schema=schema)
+                except pa.ArrowInvalid as e:
+                    # The cached schema doesn't fit this file; let Arrow infer
+                    logger.warning(f"Cached schema for {name} does not match ({e}), inferring types")
+                    self._rewind(source)
+                    schema = None
+        
+        extraction = self.config['extraction']
+        column_types = {}
+        for col, dtype in (schema or {}).items():
+            arrow_type = self._arrow_type(dtype)
+            if arrow_type is not None:
+                column_types[col] = arrow_type
+        
+        # Parse dates in Arrow's C++ reader rather than pd.to_datetime later
+        for col in extraction.get('parse_dates', []):
+            column_types[col] = pa.timestamp('ns')
+        
+        return pa_csv.read_csv(
+            source,
+            read_options=pa_csv.ReadOptions(
+                block_size=1 << 20,
+                use_threads=True,
+                encoding=extraction['encoding']
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                timestamp_parsers=[extraction.get('date_format', '%Y-%m-%d'), pa_csv.ISO8601]
+            )
+        )
     
-    def extract_from_zip(self, zip_path: Union[str, Path]) -> pd.DataFrame:
+    def _parse_csv(self, source: Union[str, Path], schema: Optional[Dict[str, str]], 
+                   **read_kwargs) -> pd.DataFrame:
+        """Parse a CSV source with the given dtype schema (None to infer)"""
+        extraction = self.config['extraction']
+        
+        if extraction.get('use_arrow', False):
+            if pa_csv is not None:
+                table = self._read_table(source, schema=schema or {})
+                # Consolidated blocks are copied into writable arrays; split
+                # blocks would be zero-copy, read-only views of Arrow memory
+                return table.to_pandas(self_destruct=True)
+            logger.warning("pyarrow not available, falling back to pandas CSV reader")
+        
+        if schema:
+            read_kwargs['dtype'] = {
+                col: dtype for col, dtype in schema.items()
+                if not dtype.startswith('datetime64')
+            }
+            read_kwargs['parse_dates'] = [
+                col for col, dtype in schema.items()
+                if dtype.startswith('datetime64')
+            ]
+        df = pd.read_csv(source, encoding=extraction['encoding'], **read_kwargs)
+        
+        date_format = extraction.get('date_format', '%Y-%m-%d')
+        for col in extraction.get('parse_dates', []):
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], format=date_format, errors='coerce')
+        return df
+    
+    def _read_csv(self, source: Union[str, Path], name: Optional[str] = None, 
+                  version: Optional[str] = None, **read_kwargs) -> pd.DataFrame:
+        """
+        Read a CSV source with the Arrow parser when enabled, else pandas
+        
+        When a dtype schema is cached for this version of ``name`` it is
+        passed to the parser, skipping type inference; otherwise (or when
+        the file no longer fits the cached schema) the inferred dtypes are
+        cached for the next run.
+        
+        Args:
+            source: Path or file-like object with CSV data
+            name: CSV file name used to key the dtype schema cache
+            version: Version of the source, defaults to the size/mtime of
+                a path; file-like sources without one are not cached
+            **read_kwargs: Extra arguments for the pandas fallback
+            
+        Returns:
+            Parsed DataFrame
+        """
+        version = version or self._source_version(source)
+        schema = self._load_schema(name, version) if name else None
+        
+        try:
+            df = self._parse_csv(source, schema, **read_kwargs)
+        except (ValueError, TypeError) as e:
+            if not schema:
+                raise
+            # e.g. a blank in a column cached as int64: re-infer and re-cache
+            logger.warning(f"Cached schema for {name} does not match ({e}), inferring dtypes")
+            self._rewind(source)
+            schema = None
+            df = self._parse_csv(source, None, **read_kwargs)
+        
+        if name and schema is None:
+            self._save_schema(name, version, df)
+        
+        return df
+    
+    @classmethod
+    def _open_zip(cls, zip_path: Union[str, Path]) -> zipfile.ZipFile:
+        """
+        Return a shared handle for a ZIP archive
+        
+        Handles are keyed by path and modification time, so a rewritten
+        archive is reopened. At most _ZIP_HANDLE_LIMIT archives stay open;
+        stale and evicted handles are closed. Callers must not close the
+        returned handle, use close_zip_handles() instead.
+        
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            Open ZipFile handle
+        """
+        path = os.fspath(zip_path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        
+        cached = cls._zip_handles.pop(path, None)
+        if cached is not None:
+            if cached[0] == mtime_ns:
+                cls._zip_handles[path] = cached
+                return cached[1]
+            cached[1].close()
+        
+        zip_ref = zipfile.ZipFile(path, 'r')
+        cls._zip_handles[path] = (mtime_ns, zip_ref)
+        while len(cls._zip_handles) > cls._ZIP_HANDLE_LIMIT:
+            cls._zip_handles.popitem(last=False)[1][1].close()
+        return zip_ref
+    
+    @classmethod
+    def close_zip_handles(cls) -> None:
+        """Close every shared ZIP handle opened by _open_zip()"""
+        while cls._zip_handles:
+            cls._zip_handles.popitem()[1][1].close()
+    
+    def list_zip_members(self, zip_path: Union[str, Path]) -> List[str]:
+        """
+        List the files in a ZIP archive through the shared handle
+        
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            Member names
+        """
+        return self._open_zip(zip_path).namelist()
+    
+    @staticmethod
+    def _list_csv_members(zip_ref: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+        """Return the non-empty CSV members of an open archive"""
+        return [
+            info for info in zip_ref.infolist()
+            if info.filename.endswith('.csv') and info.file_size > 0
+        ]
+    
+    def _read_zip_member(self, zip_ref: zipfile.ZipFile, csv_info: zipfile.ZipInfo, 
+                         reader: Optional[Callable[..., Any]] = None) -> pd.DataFrame:
+        """
+        Read a single CSV member of an open ZIP archive
+        
+        Args:
+            zip_ref: Open ZIP archive
+            csv_info: Member to read
+            reader: CSV reader to use, defaults to _read_csv
+            
+        Returns:
+            Parsed DataFrame (or whatever ``reader`` returns)
+        """
+        extraction = self.config['extraction']
+        reader = reader or self._read_csv
+        # Member size and CRC identify its content for the schema cache
+        version = f"{csv_info.file_size}-{csv_info.CRC:08x}"
+        
+        if extraction.get('stream', True):
+            if csv_info.file_size < extraction.get('mmap_threshold', 512 * 1024 ** 2):
+                # Small enough to decompress in one go and parse from memory
+                return reader(
+                    io.BytesIO(zip_ref.read(csv_info)),
+                    name=csv_info.filename,
+                    version=version
+                )
+            
+            # Parse straight from the archive, no temp file on disk
+            buffer_size = min(csv_info.file_size, 1 << 20)
+            with zip_ref.open(csv_info, 'r') as f:
+                return reader(
+                    io.BufferedReader(f, buffer_size=buffer_size),
+                    name=csv_info.filename,
+                    version=version
+                )
+        
+        # Extract to raw data directory
+        zip_ref.extract(csv_info, self.raw_path)
+        
+        # Load the CSV
+        csv_path = self.raw_path / csv_info.filename
+        return reader(
+            csv_path,
+            name=csv_info.filename,
+            version=version,
+            compression=self.config['extraction']['compression']
+        )
+    
+    def _extract_member(self, zip_path: Union[str, Path], 
+                        csv_info: zipfile.ZipInfo) -> pd.DataFrame:
+        """Read one member through its own archive handle (thread-pool task)"""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            return self._read_zip_member(zip_ref, csv_info)
+    
+    def extract_from_zip(self, zip_path: Union[str, Path], 
+                         zip_ref: Optional[zipfile.ZipFile] = None) -> pd.DataFrame:
         """
         Extract data from ZIP file
         
         Args:
             zip_path: Path to ZIP file
+            zip_ref: Already opened archive, defaults to the cached handle
             
         Returns:
             Extracted DataFrame
@@ -30,44 +365,82 @@ class DataExtractor:
         logger.info(f"Extracting data from {zip_path}")
         
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # List files in ZIP
-                file_list = zip_ref.namelist()
-                logger.info(f"Files in ZIP: {file_list}")
-                
-                # Find CSV files
-                csv_files = [f for f in file_list if f.endswith('.csv')]
-                if not csv_files:
-                    raise ValueError("No CSV files found in ZIP archive")
-                
-                # Extract first CSV file
-                csv_file = csv_files[0]
-                logger.info(f"Extracting {csv_file}")
-                
-                # Extract to raw data directory
-                zip_ref.extract(csv_file, self.raw_path)
-                
-                # Load the CSV
-                csv_path = self.raw_path / csv_file
-                df = pd.read_csv(
-                    csv_path,
-                    encoding=self.config['extraction']['encoding'],
-                    compression=self.config['extraction']['compression']
-                )
-                
-                logger.info(f"Successfully extracted data. Shape: {df.shape}")
-                return df
+            zip_ref = zip_ref or self._open_zip(zip_path)
+            
+            # List files in ZIP
+            file_list = zip_ref.namelist()
+            logger.info(f"Files in ZIP: {file_list}")
+            
+            # Find CSV files, skipping empty members
+            csv_files = self._list_csv_members(zip_ref)
+            if not csv_files:
+                raise ValueError("No CSV files found in ZIP archive")
+            
+            # Extract first CSV file
+            csv_info = csv_files[0]
+            csv_file = csv_info.filename
+            logger.info(f"Extracting {csv_file}")
+            
+            df = self._read_zip_member(zip_ref, csv_info)
+            
+            logger.info(f"Successfully extracted data. Shape: {df.shape}")
+            return df
                 
         except Exception as e:
             logger.error(f"Failed to extract data: {str(e)}")
             raise
     
-    def extract_from_csv(self, csv_path: Union[str, Path]) -> pd.DataFrame:
+    def extract_all_from_zip(self, zip_path: Union[str, Path]) -> Dict[str, pd.DataFrame]:
+        """
+        Extract every CSV file from a ZIP archive
+        
+        Members are decompressed in parallel, each worker using its own
+        archive handle so reads do not serialize on a shared file lock.
+        
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            Dictionary mapping member name to DataFrame
+        """
+        logger.info(f"Extracting all CSV files from {zip_path}")
+        
+        try:
+            zip_ref = self._open_zip(zip_path)
+            csv_files = self._list_csv_members(zip_ref)
+            if not csv_files:
+                raise ValueError("No CSV files found in ZIP archive")
+            
+            if len(csv_files) == 1:
+                csv_info = csv_files[0]
+                return {csv_info.filename: self._read_zip_member(zip_ref, csv_info)}
+            
+            max_workers = self.config['extraction'].get(
+                'max_workers', min(len(csv_files), os.cpu_count() or 1)
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    info.filename: executor.submit(self._extract_member, zip_path, info)
+                    for info in csv_files
+                }
+                frames = {name: future.result() for name, future in futures.items()}
+            
+            for name, df in frames.items():
+                logger.info(f"Extracted {name}. Shape: {df.shape}")
+            return frames
+            
+        except Exception as e:
+            logger.error(f"Failed to extract data: {str(e)}")
+            raise
+    
+    def extract_from_csv(self, csv_path: Union[str, Path], **read_csv_kwargs) -> pd.DataFrame:
         """
         Extract data from CSV file
         
         Args:
             csv_path: Path to CSV file
+            **read_csv_kwargs: Extra arguments for pd.read_csv, e.g.
+                engine='pyarrow' (ignored when extraction.use_arrow is set)
             
         Returns:
             Extracted DataFrame
@@ -75,10 +448,7 @@ class DataExtractor:
         logger.info(f"Loading data from {csv_path}")
         
         try:
-            df = pd.read_csv(
-                csv_path,
-                encoding=self.config['extraction']['encoding']
-            )
+            df = self._read_csv(csv_path, name=Path(csv_path).name, **read_csv_kwargs)
             logger.info(f"Successfully loaded data. Shape: {df.shape}")
             return df
             
@@ -86,6 +456,85 @@ class DataExtractor:
             logger.error(f"Failed to load CSV: {str(e)}")
             raise
     
+    def extract_from_parquet(self, parquet_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Extract data from Parquet file
+        
+        Args:
+            parquet_path: Path to Parquet file
+            
+        Returns:
+            Extracted DataFrame
+        """
+        logger.info(f"Loading data from {parquet_path}")
+        
+        try:
+            df = pd.read_parquet(parquet_path, engine='pyarrow')
+            logger.info(f"Successfully loaded data. Shape: {df.shape}")
+            return df
+            
+        except Exception as e:
+            logger.error(f"Failed to load Parquet: {str(e)}")
+            raise
+    
+    def extract_from_feather(self, feather_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Extract data from Feather (Arrow IPC) file
+        
+        Args:
+            feather_path: Path to Feather file
+            
+        Returns:
+            Extracted DataFrame
+        """
+        logger.info(f"Loading data from {feather_path}")
+        
+        try:
+            df = pd.read_feather(feather_path)
+            logger.info(f"Successfully loaded data. Shape: {df.shape}")
+            return df
+            
+        except Exception as e:
+            logger.error(f"Failed to load Feather: {str(e)}")
+            raise
+    
+    def extract_table(self, source_path: Union[str, Path], 
+                      source_type: Optional[str] = None) -> "pa.Table":
+        """
+        Extract data as an Arrow table, without converting to pandas
+        
+        Args:
+            source_path: Path to data source
+            source_type: Type of source (zip, csv, auto)
+            
+        Returns:
+            Extracted Arrow table
+        """
+        if pa_csv is None:
+            raise ImportError("pyarrow is required for extract_table")
+        
+        source_path = Path(source_path)
+        source_type = source_type or source_path.suffix.lstrip('.').lower()
+        logger.info(f"Extracting Arrow table from {source_path}")
+        
+        if source_type == 'zip':
+            zip_ref = self._open_zip(source_path)
+            csv_files = self._list_csv_members(zip_ref)
+            if not csv_files:
+                raise ValueError("No CSV files found in ZIP archive")
+            table = self._read_zip_member(zip_ref, csv_files[0], reader=self._read_table)
+        elif source_type == 'csv':
+            table = self._read_table(source_path, name=source_path.name)
+        elif source_type == 'parquet':
+            table = pq.read_table(source_path)
+        elif source_type == 'feather':
+            table = feather.read_table(source_path)
+        else:
+            raise ValueError(f"Unsupported source type: {source_type}")
+        
+        logger.info(f"Successfully extracted table. Shape: {table.shape}")
+        return table
+    
     def extract(self, source_path: Union[str, Path], 
                 source_type: Optional[str] = None) -> pd.DataFrame:
         """
@@ -93,7 +542,7 @@ class DataExtractor:
         
         Args:
             source_path: Path to data source
-            source_type: Type of source (zip, csv, auto)
+            source_type: Type of source (zip, csv, parquet, feather, auto)
             
         Returns:
             Extracted DataFrame
@@ -102,16 +551,12 @@ class DataExtractor:
         
         if source_type is None:
             # Auto-detect source type
-            if source_path.suffix.lower() == '.zip':
-                source_type = 'zip'
-            elif source_path.suffix.lower() == '.csv':
-                source_type = 'csv'
-            else:
+            source_type = source_path.suffix.lstrip('.').lower()
+            if source_type not in self._readers:
                 raise ValueError(f"Unsupported file type: {source_path.suffix}")
         
-        if source_type == 'zip':
-            return self.extract_from_zip(source_path)
-        elif source_type == 'csv':
-            return self.extract_from_csv(source_path)
-        else:
+        reader = self._readers.get(source_type)
+        if reader is None:
             raise ValueError(f"Unsupported source type: {source_type}")
+        
+        return reader(source_path)
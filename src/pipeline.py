@@ -3,11 +3,26 @@ ETL Pipeline for NYC Airbnb Data
 """
 
 import pandas as pd
+import numpy as np
+import io
+import json
 import zipfile
 import os
+import shutil
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - falls back to pandas' C parser
+    pa = None
+    pq = None
+    pa_csv = None
 
 # Configure logging
 logging.basicConfig(
@@ -20,18 +35,272 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Known column types of the NYC Airbnb listings file, so the CSV reader
+# skips type inference and keeps low-cardinality text as categories.
+# Price stays text because it may carry "$" and "," (cleaned in transform).
+AIRBNB_DTYPES = {
+    'id': 'int64',
+    'name': 'str',
+    'host_id': 'int64',
+    'host_name': 'str',
+    'neighbourhood_group': 'category',
+    'neighbourhood': 'category',
+    'latitude': 'float32',
+    'longitude': 'float32',
+    'room_type': 'category',
+    'price': 'str',
+    'minimum_nights': 'int32',
+    'number_of_reviews': 'int32',
+    'reviews_per_month': 'float32',
+    'calculated_host_listings_count': 'int32',
+    'availability_365': 'int16',
+}
+PARSE_DATES = ['last_review', 'host_since']
+
+# Identifier columns, never downcast (same rule as DataLoader._optimize_dtypes)
+KEY_COLUMNS = ['id', 'host_id']
+
+# Pinned output column types, shared by the in-memory and chunked runs so
+# both write the same Parquet schema whatever the data holds
+OUTPUT_DTYPES = {
+    **{col: 'int64' for col in KEY_COLUMNS},
+    'latitude': 'float32',
+    'longitude': 'float32',
+    'price': 'float32',
+    'minimum_nights': 'int32',
+    'number_of_reviews': 'int32',
+    'last_review': 'datetime64[ns]',
+    'host_since': 'datetime64[ns]',
+    'reviews_per_month': 'float32',
+    'calculated_host_listings_count': 'int32',
+    'availability_365': 'int16',
+    'days_since_last_review': 'int32',
+    'price_per_night': 'float32',
+    'is_available': 'bool',
+}
+
+# Low-cardinality text columns that get Parquet dictionary encoding
+PARQUET_DICT_COLUMNS = ['neighbourhood_group', 'room_type', 'neighbourhood', 'host_name']
+
+# Column-name cleanup: spaces and dashes become underscores in one pass
+_COL_TT = str.maketrans({' ': '_', '-': '_'})
+
+if pa is not None:
+    # Same schema for Arrow's CSV reader; columns absent from the file are ignored
+    AIRBNB_ARROW_SCHEMA = {
+        col: (pa.dictionary(pa.int32(), pa.string()) if dtype == 'category'
+              else pa.string() if dtype == 'str'
+              else pa.from_numpy_dtype(dtype))
+        for col, dtype in AIRBNB_DTYPES.items()
+    }
+    AIRBNB_ARROW_SCHEMA.update({col: pa.timestamp('ns') for col in PARSE_DATES})
+
+
+# Decompressed CSV members keyed on (path, mtime), most recent last
+_ZIP_CSV_CACHE = OrderedDict()
+_ZIP_CSV_CACHE_SIZE = 4
+
+
+def _read_zip_csv_bytes(zip_path, mtime, open_member):
+    """
+    Decompress the first CSV member of a ZIP file
+    
+    Cached on (path, mtime) so repeated extracts of an unchanged archive
+    skip the decompression; a modified file gets a new cache entry. The
+    archive is only opened on a cache miss.
+    
+    Args:
+        zip_path: Path to ZIP file
+        mtime: Modification time of the file, part of the cache key
+        open_member: Callable returning the open ZipFile and its CSV name
+        
+    Returns:
+        Tuple with the CSV member name and its decompressed bytes
+    """
+    key = (zip_path, mtime)
+    if key in _ZIP_CSV_CACHE:
+        _ZIP_CSV_CACHE.move_to_end(key)
+        return _ZIP_CSV_CACHE[key]
+    
+    zip_ref, csv_file = open_member()
+    with zip_ref:
+        result = (csv_file, zip_ref.read(csv_file))
+    
+    _ZIP_CSV_CACHE[key] = result
+    if len(_ZIP_CSV_CACHE) > _ZIP_CSV_CACHE_SIZE:
+        _ZIP_CSV_CACHE.popitem(last=False)
+    return result
+
+
+def _shrink(df):
+    """
+    Cast columns to the pinned output types and make low-cardinality text categorical
+    
+    Args:
+        df: DataFrame to shrink (modified in place)
+        
+    Returns:
+        The same DataFrame with the OUTPUT_DTYPES column types
+    """
+    for col, dtype in OUTPUT_DTYPES.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        # Integer columns with gaps become the nullable type of the same width
+        if dtype.startswith('int') and df[col].hasnans:
+            dtype = dtype.capitalize()
+        df[col] = df[col].astype(dtype)
+    
+    for col in ('neighbourhood_group', 'room_type'):
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _arrow_output_schema(schema):
+    """
+    Widen dictionary indices to int32 in an Arrow schema
+    
+    Category codes may be int8 or int16 depending on how many categories
+    a frame holds; fixing the index width keeps the Parquet schema stable.
+    
+    Args:
+        schema: Arrow schema built from a processed DataFrame
+        
+    Returns:
+        Schema with int32 dictionary indices
+    """
+    return pa.schema(
+        [
+            pa.field(f.name, pa.dictionary(pa.int32(), f.type.value_type))
+            if pa.types.is_dictionary(f.type) else f
+            for f in schema
+        ],
+        metadata=schema.metadata
+    )
+
+
+def _transform_chunk(chunk):
+    """
+    Transform one chunk in a worker process
+    
+    Module-level (no bound instance) so ProcessPoolExecutor can pickle it.
+    
+    Args:
+        chunk: DataFrame with raw data
+        
+    Returns:
+        DataFrame with transformed data
+    """
+    return _shrink(NYC_Airbnb_ETL(keep_frames=False).transform(chunk))
+
+
+def _transform_parallel(chunks, workers):
+    """
+    Transform chunks on a process pool, yielding results in input order
+    
+    At most 2 * workers chunks are in flight, so the reader is only pulled
+    ahead of the writer by a bounded amount (unlike Executor.map, which
+    submits the whole input up front).
+    
+    Args:
+        chunks: Iterable of raw DataFrames
+        workers: Number of worker processes
+        
+    Yields:
+        Transformed DataFrames
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_transform_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 
 class NYC_Airbnb_ETL:
     """
     Main ETL pipeline class for NYC Airbnb data
     """
     
-    def __init__(self):
-        """Initialize the pipeline"""
+    def __init__(self, keep_frames=True):
+        """
+        Initialize the pipeline
+        
+        Args:
+            keep_frames: Keep the raw and processed DataFrames on the
+                instance (self.data / self.processed_data)
+        """
+        self.keep_frames = keep_frames
         self.data = None
         self.processed_data = None
+        self._zip_handle = None
         logger.info("ETL Pipeline initialized")
     
+    def preflight(self, zip_path):
+        """
+        Open the ZIP file once and report its size and CSV members
+        
+        The open archive is kept and reused by extract() and
+        extract_chunks() for the same path, so the central directory is
+        only read once per run.
+        
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            Dictionary with size_mb and csv_files
+        """
+        # A second preflight replaces the handle kept by the first one
+        if self._zip_handle is not None:
+            self._zip_handle[1].close()
+            self._zip_handle = None
+        
+        zip_ref = zipfile.ZipFile(zip_path, 'r')
+        self._zip_handle = (os.fspath(zip_path), zip_ref)
+        
+        return {
+            'size_mb': os.fstat(zip_ref.fp.fileno()).st_size / 1024 / 1024,
+            'csv_files': [f for f in zip_ref.namelist() if f.lower().endswith('.csv')]
+        }
+    
+    def _open_csv_member(self, zip_path):
+        """
+        Open the ZIP file and locate the CSV to process
+        
+        Args:
+            zip_path: Path to ZIP file
+            
+        Returns:
+            Tuple with the open ZipFile and the name of its first CSV file
+        """
+        if self._zip_handle is not None and self._zip_handle[0] == os.fspath(zip_path):
+            # Reuse the archive opened by preflight()
+            zip_ref = self._zip_handle[1]
+            self._zip_handle = None
+        else:
+            # Check if file exists
+            if not os.path.exists(zip_path):
+                raise FileNotFoundError(f"File not found: {zip_path}")
+            zip_ref = zipfile.ZipFile(zip_path, 'r')
+        
+        # List files in ZIP
+        file_list = zip_ref.namelist()
+        logger.info(f"Files in ZIP: {file_list}")
+        
+        # Look for CSV files
+        csv_files = [f for f in file_list if f.lower().endswith('.csv')]
+        
+        if not csv_files:
+            zip_ref.close()
+            raise ValueError("No CSV files found in ZIP")
+        
+        # Take first CSV file
+        csv_file = csv_files[0]
+        logger.info(f"Processing file: {csv_file}")
+        return zip_ref, csv_file
+    
     def extract(self, zip_path):
         """
         Extract data from ZIP file
@@ -49,38 +318,87 @@ class NYC_Airbnb_ETL:
             if not os.path.exists(zip_path):
                 raise FileNotFoundError(f"File not found: {zip_path}")
             
-            # Open ZIP file
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # List files in ZIP
-                file_list = zip_ref.namelist()
-                logger.info(f"Files in ZIP: {file_list}")
-                
-                # Look for CSV files
-                csv_files = [f for f in file_list if f.lower().endswith('.csv')]
-                
-                if not csv_files:
-                    raise ValueError("No CSV files found in ZIP")
-                
-                # Take first CSV file
-                csv_file = csv_files[0]
-                logger.info(f"Processing file: {csv_file}")
-                
-                # Extract and read CSV
-                with zip_ref.open(csv_file) as f:
-                    df = pd.read_csv(f)
-                
-                logger.info(f"Data extracted successfully - Rows: {df.shape[0]}, Columns: {df.shape[1]}")
+            # Decompress in one bulk read, memoized per (path, mtime); a miss
+            # reads through the archive preflight() already opened
+            csv_file, raw = _read_zip_csv_bytes(
+                os.fspath(zip_path),
+                os.path.getmtime(zip_path),
+                lambda: self._open_csv_member(zip_path)
+            )
+            
+            # On a cache hit the preflight archive was not needed
+            if self._zip_handle is not None:
+                self._zip_handle[1].close()
+                self._zip_handle = None
+            
+            if pa_csv is not None:
+                table = pa_csv.read_csv(
+                    pa.BufferReader(raw),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types=AIRBNB_ARROW_SCHEMA,
+                        timestamp_parsers=['%Y-%m-%d', pa_csv.ISO8601]
+                    )
+                )
+                df = table.to_pandas(self_destruct=True)
+            else:
+                # Only ask for the date columns this file actually has
+                header = pd.read_csv(io.BytesIO(raw), nrows=0).columns
+                parse_dates = [col for col in PARSE_DATES if col in header]
+                df = pd.read_csv(
+                    io.BytesIO(raw),
+                    dtype=AIRBNB_DTYPES,
+                    parse_dates=parse_dates
+                )
+            
+            logger.info(f"Data extracted successfully - Rows: {df.shape[0]}, Columns: {df.shape[1]}")
+            if self.keep_frames:
                 self.data = df
-                return df
+            return df
                 
         except Exception as e:
             logger.error(f"Extraction error: {str(e)}")
             raise
     
+    def extract_chunks(self, zip_path, chunksize=500_000):
+        """
+        Extract data from ZIP file in chunks
+        
+        The CSV is decompressed and parsed incrementally, so only one
+        chunk is held in memory at a time.
+        
+        Args:
+            zip_path: Path to ZIP file
+            chunksize: Rows per chunk
+            
+        Yields:
+            DataFrames with at most chunksize rows
+        """
+        logger.info(f"Extracting data in chunks of {chunksize} rows from: {zip_path}")
+        
+        zip_ref, csv_file = self._open_csv_member(zip_path)
+        with zip_ref:
+            # Only ask for the date columns this file actually has
+            with zip_ref.open(csv_file) as f:
+                header = pd.read_csv(f, nrows=0).columns
+            parse_dates = [col for col in PARSE_DATES if col in header]
+            
+            with zip_ref.open(csv_file) as f:
+                reader = pd.read_csv(
+                    f,
+                    chunksize=chunksize,
+                    dtype=AIRBNB_DTYPES,
+                    parse_dates=parse_dates
+                )
+                for chunk in reader:
+                    yield chunk
+    
     def transform(self, df):
         """
         Transform and clean data
         
+        The input frame is cleaned in place rather than copied; callers
+        must not rely on it being unchanged afterwards.
+        
         Args:
             df: DataFrame with raw data
             
@@ -89,85 +407,101 @@ class NYC_Airbnb_ETL:
         """
         logger.info("Starting data transformation...")
         
-        # Make a copy to avoid modifying original
-        df_clean = df.copy()
+        # Reference time for all date features, taken once in UTC so DST
+        # changes cannot shift the day counts mid-run
+        now_ns = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), 'ns').astype(np.int64)
+        
+        df_clean = df
         
         # 1. Clean column names
-        df_clean.columns = [
-            col.strip().lower().replace(' ', '_').replace('-', '_')
-            for col in df_clean.columns
-        ]
+        df_clean.columns = df_clean.columns.str.strip().str.lower().str.translate(_COL_TT)
         logger.info(f"Columns after cleaning: {list(df_clean.columns)}")
         
+        # Low-cardinality text as categories, so the passes below compare codes
+        for col in ('neighbourhood_group', 'room_type', 'neighbourhood'):
+            if col in df_clean.columns and not isinstance(df_clean[col].dtype, pd.CategoricalDtype):
+                df_clean[col] = df_clean[col].astype('category')
+        
         # 2. Remove completely empty rows
         initial_rows = len(df_clean)
-        df_clean = df_clean.dropna(how='all')
+        df_clean.dropna(how='all', inplace=True)
         logger.info(f"Rows removed (completely empty): {initial_rows - len(df_clean)}")
         
-        # 3. Remove duplicates
-        df_clean = df_clean.drop_duplicates()
+        # 3. Remove duplicates (id is the listing key, so hash only that when present)
+        df_clean.drop_duplicates(subset='id' if 'id' in df_clean.columns else None, inplace=True)
         logger.info(f"Rows after removing duplicates: {len(df_clean)}")
         
-        # 4. Handle missing values
-        missing_percent = (df_clean.isnull().sum() / len(df_clean)) * 100
-        logger.info("Percentage of missing values per column:")
-        for col, percent in missing_percent.items():
-            if percent > 0:
-                logger.info(f"  {col}: {percent:.2f}%")
+        # 4. Report missing values (diagnostic only, so skip the scan unless debugging)
+        if logger.isEnabledFor(logging.DEBUG):
+            missing_percent = df_clean.isnull().mean().mul(100)
+            logger.debug("Percentage of missing values per column:")
+            for col, percent in missing_percent[missing_percent > 0].items():
+                logger.debug(f"  {col}: {percent:.2f}%")
         
         # 5. Clean price column
         if 'price' in df_clean.columns:
             logger.info("Cleaning 'price' column...")
-            # Convert to string, remove symbols, convert to float
-            df_clean['price'] = (
-                df_clean['price']
-                .astype(str)
-                .str.replace(r'[\$,]', '', regex=True)
-                .astype(float, errors='coerce')
-            )
+            # Already numeric when the reader could type it; otherwise strip
+            # "$" and "," with literal replaces (no per-cell regex) and convert
+            if not pd.api.types.is_numeric_dtype(df_clean['price']):
+                prices = df_clean['price'].astype('string')
+                prices = prices.str.replace('$', '', regex=False).str.replace(',', '', regex=False)
+                df_clean['price'] = pd.to_numeric(prices, errors='coerce').astype('float64')
             
-            # Filter valid prices
-            valid_prices = df_clean['price'].between(0, 10000)
-            df_clean = df_clean[valid_prices]
-            logger.info(f"Valid prices (0-10000): {valid_prices.sum()} rows")
+            # Filter valid prices with one NumPy compare; NaN fails both bounds
+            prices = df_clean['price'].to_numpy(dtype=np.float64, na_value=np.nan)
+            valid_prices = (prices >= 0) & (prices <= 10000)
+            df_clean = df_clean.iloc[np.flatnonzero(valid_prices)]
+            logger.info(f"Valid prices (0-10000): {np.count_nonzero(valid_prices)} rows")
         
         # 6. Convert dates
         date_columns = ['last_review', 'host_since']
         for col in date_columns:
-            if col in df_clean.columns:
+            # Columns parsed by the CSV reader are already datetime
+            if col in df_clean.columns and not pd.api.types.is_datetime64_any_dtype(df_clean[col]):
                 df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
                 logger.info(f"Converted date column: {col}")
         
         # 7. Create new features
         if 'last_review' in df_clean.columns:
-            # Days since last review
-            df_clean['days_since_last_review'] = (
-                datetime.now() - df_clean['last_review']
-            ).dt.days
-            df_clean['days_since_last_review'] = df_clean['days_since_last_review'].fillna(-1)
+            # Days since last review, computed on int64 nanoseconds; NaT -> -1
+            last_review = df_clean['last_review'].to_numpy('datetime64[ns]').view('i8')
+            days = np.where(
+                last_review == np.iinfo(np.int64).min,
+                -1,
+                (now_ns - last_review) // 86_400_000_000_000
+            )
+            df_clean['days_since_last_review'] = days.astype(np.int32)
         
         if 'price' in df_clean.columns and 'minimum_nights' in df_clean.columns:
-            # Price per night
-            df_clean['price_per_night'] = df_clean['price'] / df_clean['minimum_nights'].clip(lower=1)
+            # Price per night; nights clamped to 1 on the raw array, not a clipped Series copy
+            min_nights = np.maximum(df_clean['minimum_nights'].to_numpy(dtype=np.float64, na_value=np.nan), 1)
+            df_clean['price_per_night'] = (df_clean['price'].to_numpy(dtype=np.float64, na_value=np.nan) / min_nights).astype(np.float32)
         
         if 'availability_365' in df_clean.columns:
             # Availability boolean
             df_clean['is_available'] = df_clean['availability_365'] > 0
         
         logger.info(f"Transformation completed - Rows: {df_clean.shape[0]}, Columns: {df_clean.shape[1]}")
-        self.processed_data = df_clean
+        if self.keep_frames:
+            self.processed_data = df_clean
         return df_clean
     
-    def load(self, df, output_dir="data/processed"):
+    def load(self, df, output_dir="data/processed", formats=('parquet',)):
         """
         Save processed data
         
+        Parquet is always written; CSV is opt-in since it is by far the
+        slower format to serialize.
+        
         Args:
             df: DataFrame with processed data
             output_dir: Output directory
+            formats: Output formats; include 'csv' to also write CSV files
             
         Returns:
-            Tuple with paths to saved files
+            Tuple with paths to saved files (the CSV path is None when
+            CSV was not requested)
         """
         logger.info(f"Saving processed data to: {output_dir}")
         
@@ -177,27 +511,78 @@ class NYC_Airbnb_ETL:
         # Generate timestamp for unique names
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Save as CSV
-        csv_filename = f"nyc_airbnb_processed_{timestamp}.csv"
-        csv_path = os.path.join(output_dir, csv_filename)
-        df.to_csv(csv_path, index=False)
-        logger.info(f"CSV saved: {csv_path}")
-        
         # Save as Parquet (more efficient)
         parquet_filename = f"nyc_airbnb_processed_{timestamp}.parquet"
         parquet_path = os.path.join(output_dir, parquet_filename)
-        df.to_parquet(parquet_path, index=False)
+        if pq is not None:
+            # Write through Arrow directly to control encoding and row groups;
+            # statistics let downstream readers skip row groups
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.cast(_arrow_output_schema(table.schema))
+            pq.write_table(
+                table,
+                parquet_path,
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=[c for c in PARQUET_DICT_COLUMNS if c in table.column_names],
+                row_group_size=256_000,
+                data_page_size=1 << 20,
+                write_statistics=True
+            )
+        else:
+            df.to_parquet(parquet_path, index=False, compression='zstd')
         logger.info(f"Parquet saved: {parquet_path}")
         
-        # Also save a file without timestamp for reference
-        latest_csv = os.path.join(output_dir, "nyc_airbnb_latest.csv")
-        df.to_csv(latest_csv, index=False)
+        csv_path = None
+        if 'csv' in formats:
+            csv_filename = f"nyc_airbnb_processed_{timestamp}.csv"
+            csv_path = os.path.join(output_dir, csv_filename)
+            with open(csv_path, 'wb', buffering=1 << 20) as f:
+                df.to_csv(f, index=False, lineterminator='\n')
+            logger.info(f"CSV saved: {csv_path}")
+            
+            # Also keep a copy without timestamp for reference
+            latest_csv = os.path.join(output_dir, "nyc_airbnb_latest.csv")
+            shutil.copyfile(csv_path, latest_csv)
         
         # Create metadata file
         self._save_metadata(df, output_dir, timestamp)
         
         return csv_path, parquet_path
     
+    def load_chunks(self, chunks, output_dir="data/processed"):
+        """
+        Stream processed chunks into a single Parquet file
+        
+        Args:
+            chunks: Iterable of processed DataFrames
+            output_dir: Output directory
+            
+        Returns:
+            Tuple with the Parquet path and the number of rows written
+        """
+        logger.info(f"Streaming processed data to: {output_dir}")
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        parquet_path = os.path.join(output_dir, f"nyc_airbnb_processed_{timestamp}.parquet")
+        
+        writer = None
+        rows = 0
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(parquet_path, _arrow_output_schema(table.schema))
+                writer.write_table(table.cast(writer.schema))
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        logger.info(f"Parquet saved: {parquet_path} ({rows} rows)")
+        return parquet_path, rows
+    
     def _save_metadata(self, df, output_dir, timestamp):
         """Save processing metadata"""
         metadata = {
@@ -208,47 +593,59 @@ class NYC_Airbnb_ETL:
             'data_types': dict(df.dtypes.astype(str))
         }
         
-        metadata_path = os.path.join(output_dir, f"metadata_{timestamp}.txt")
+        # Structured JSON, serialized up front and written in a single call
+        metadata_path = os.path.join(output_dir, f"metadata_{timestamp}.json")
         with open(metadata_path, 'w') as f:
-            for key, value in metadata.items():
-                f.write(f"{key}: {value}\n")
+            f.write(json.dumps(metadata, indent=2) + "\n")
         
         logger.info(f"Metadata saved: {metadata_path}")
     
-    def run(self, zip_path, output_dir="data/processed"):
+    def run(self, zip_path, output_dir="data/processed", chunksize=None, formats=('parquet',), workers=None):
         """
         Run complete pipeline
         
         Args:
             zip_path: Path to ZIP file
             output_dir: Output directory
+            chunksize: If set, stream the data through the pipeline in
+                chunks of this many rows, bounding peak memory
+            formats: Output formats passed to load (ignored in chunked
+                mode, which only writes Parquet)
+            workers: Worker processes for chunked mode (defaults to the
+                CPU count; 1 transforms in this process)
             
         Returns:
-            DataFrame with processed data
+            DataFrame with processed data, or the Parquet path when
+            running in chunked mode
         """
         logger.info("=" * 60)
         logger.info("STARTING ETL PIPELINE - NYC AIRBNB")
         logger.info("=" * 60)
         
+        if chunksize:
+            return self._run_chunked(zip_path, output_dir, chunksize, workers)
+        
         try:
             # 1. EXTRACTION
             raw_data = self.extract(zip_path)
+            raw_shape = raw_data.shape
             
             # 2. TRANSFORMATION
-            processed_data = self.transform(raw_data)
+            processed_data = _shrink(self.transform(raw_data))
             
             # 3. LOADING
-            csv_path, parquet_path = self.load(processed_data, output_dir)
+            csv_path, parquet_path = self.load(processed_data, output_dir, formats)
             
             # 4. SUMMARY
             logger.info("=" * 60)
             logger.info("PIPELINE COMPLETED SUCCESSFULLY")
             logger.info("=" * 60)
             logger.info(f"Summary:")
-            logger.info(f"  - Raw data: {raw_data.shape[0]} rows, {raw_data.shape[1]} columns")
+            logger.info(f"  - Raw data: {raw_shape[0]} rows, {raw_shape[1]} columns")
             logger.info(f"  - Processed data: {processed_data.shape[0]} rows, {processed_data.shape[1]} columns")
             logger.info(f"  - Generated files:")
-            logger.info(f"      • CSV: {csv_path}")
+            if csv_path:
+                logger.info(f"      • CSV: {csv_path}")
             logger.info(f"      • Parquet: {parquet_path}")
             logger.info("=" * 60)
             
@@ -257,3 +654,49 @@ class NYC_Airbnb_ETL:
         except Exception as e:
             logger.error(f"Pipeline error: {str(e)}")
             raise
+    
+    def _run_chunked(self, zip_path, output_dir, chunksize, workers=None):
+        """
+        Run the pipeline chunk by chunk, writing straight to Parquet
+        
+        Duplicates are only removed within each chunk in this mode. With
+        more than one worker, chunks are transformed on a process pool
+        while the reader parses the next ones and the writer appends the
+        finished ones.
+        
+        Args:
+            zip_path: Path to ZIP file
+            output_dir: Output directory
+            chunksize: Rows per chunk
+            workers: Worker processes for transform (defaults to the CPU count)
+            
+        Returns:
+            Path to the Parquet file
+        """
+        workers = workers or os.cpu_count() or 1
+        keep_frames = self.keep_frames
+        self.keep_frames = False
+        try:
+            chunks = self.extract_chunks(zip_path, chunksize)
+            if workers > 1:
+                processed = _transform_parallel(chunks, workers)
+            else:
+                processed = (_shrink(self.transform(chunk)) for chunk in chunks)
+            parquet_path, rows = self.load_chunks(processed, output_dir)
+            
+            logger.info("=" * 60)
+            logger.info("PIPELINE COMPLETED SUCCESSFULLY")
+            logger.info("=" * 60)
+            logger.info(f"Summary:")
+            logger.info(f"  - Processed data: {rows} rows")
+            logger.info(f"  - Generated files:")
+            logger.info(f"      • Parquet: {parquet_path}")
+            logger.info("=" * 60)
+            
+            return parquet_path
+            
+        except Exception as e:
+            logger.error(f"Pipeline error: {str(e)}")
+            raise
+        finally:
+            self.keep_frames = keep_frames
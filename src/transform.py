@@ -1,12 +1,16 @@
 """
 Transformation module for NYC Airbnb data
 """
+import warnings
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from loguru import logger
 
+# Column-name cleanup: spaces become underscores
+_COL_TT = str.maketrans({' ': '_'})
+
 class DataTransformer:
     """Handles data transformation and cleaning"""
     
@@ -18,6 +22,9 @@ class DataTransformer:
         """
         Clean the raw data
         
+        The input frame is cleaned in place rather than copied; callers
+        must not rely on it being unchanged afterwards.
+        
         Args:
             df: Raw DataFrame
             
@@ -25,15 +32,14 @@ class DataTransformer:
             Cleaned DataFrame
         """
         logger.info("Starting data cleaning")
-        df_clean = df.copy()
+        df_clean = df
         
         # 1. Handle column names
-        df_clean.columns = [col.strip().lower().replace(' ', '_') 
-                           for col in df_clean.columns]
+        df_clean.columns = df_clean.columns.str.strip().str.lower().str.translate(_COL_TT)
         
-        # 2. Remove duplicate rows
+        # 2. Remove duplicate rows (id is the listing key, so hash only that when present)
         initial_rows = len(df_clean)
-        df_clean = df_clean.drop_duplicates()
+        df_clean.drop_duplicates(subset='id' if 'id' in df_clean.columns else None, inplace=True)
         logger.info(f"Removed {initial_rows - len(df_clean)} duplicate rows")
         
         # 3. Handle missing values
@@ -49,26 +55,29 @@ class DataTransformer:
             df_clean = df_clean.drop(columns=cols_to_drop)
         
         # 4. Clean numeric columns
-        numeric_cols = self.transform_config.get('numeric_cols', [])
+        numeric_cols = [c for c in self.transform_config.get('numeric_cols', []) if c in df_clean.columns]
         for col in numeric_cols:
-            if col in df_clean.columns:
-                # Convert to numeric, coerce errors
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-                
-                # Remove negative prices
-                if col == 'price':
-                    df_clean = df_clean[df_clean[col] >= 0]
-                
-                # Handle outliers using IQR method
-                if self.transform_config.get('outlier_method') == 'iqr':
-                    Q1 = df_clean[col].quantile(0.25)
-                    Q3 = df_clean[col].quantile(0.75)
-                    IQR = Q3 - Q1
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
-                    
-                    # Cap outliers instead of removing
-                    df_clean[col] = df_clean[col].clip(lower_bound, upper_bound)
+            # Convert to numeric, coerce errors
+            df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+        
+        # Remove negative prices
+        if 'price' in numeric_cols:
+            df_clean = df_clean[df_clean['price'] >= 0]
+        
+        # Handle outliers using IQR method, all columns in one quantile pass
+        if numeric_cols and len(df_clean) and self.transform_config.get('outlier_method') == 'iqr':
+            arr = df_clean[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            with np.errstate(invalid='ignore'), warnings.catch_warnings():
+                # All-NaN columns yield NaN quartiles; they are left unclipped below
+                warnings.simplefilter('ignore', RuntimeWarning)
+                q1, q3 = np.nanquantile(arr, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            lower_bound = np.nan_to_num(q1 - 1.5 * iqr, nan=-np.inf)
+            upper_bound = np.nan_to_num(q3 + 1.5 * iqr, nan=np.inf)
+            
+            # Cap outliers instead of removing
+            np.clip(arr, lower_bound, upper_bound, out=arr)
+            df_clean[numeric_cols] = arr
         
         # 5. Clean categorical columns
         categorical_cols = self.transform_config.get('categorical_cols', [])
@@ -81,7 +90,8 @@ class DataTransformer:
         # 6. Clean date columns
         date_cols = self.transform_config.get('date_cols', [])
         for col in date_cols:
-            if col in df_clean.columns:
+            # Columns parsed at extraction time are already datetime
+            if col in df_clean.columns and not pd.api.types.is_datetime64_any_dtype(df_clean[col]):
                 df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
         
         logger.info(f"Data cleaning complete. Shape: {df_clean.shape}")
@@ -100,30 +110,39 @@ class DataTransformer:
         logger.info("Engineering new features")
         df_features = df.copy()
         
+        # Reference time for date features, taken once in UTC
+        now_ns = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), 'ns').astype(np.int64)
+        
         features_to_create = self.transform_config.get('create_features', [])
         
         if 'price_per_night' in features_to_create:
             if 'price' in df_features.columns and 'minimum_nights' in df_features.columns:
-                df_features['price_per_night'] = df_features['price'] / df_features['minimum_nights'].clip(lower=1)
+                # At least one night, clamped on the raw array instead of a clipped Series copy
+                min_nights = np.maximum(df_features['minimum_nights'].to_numpy(dtype=np.float64, na_value=np.nan), 1)
+                df_features['price_per_night'] = (df_features['price'].to_numpy(dtype=np.float64, na_value=np.nan) / min_nights).astype(np.float32)
         
         if 'has_availability' in features_to_create:
             if 'availability_365' in df_features.columns:
-                df_features['has_availability'] = df_features['availability_365'] > 0
+                availability = df_features['availability_365'].to_numpy(dtype=np.float64, na_value=np.nan)
+                df_features['has_availability'] = availability > 0
         
         if 'review_recency' in features_to_create:
             if 'last_review' in df_features.columns:
-                df_features['review_recency'] = (
-                    datetime.now() - df_features['last_review']
-                ).dt.days
-                df_features['review_recency'] = df_features['review_recency'].fillna(-1)
+                # Whole days on int64 nanoseconds; NaT maps to -1
+                last_review = df_features['last_review'].to_numpy('datetime64[ns]').view('i8')
+                days = np.where(
+                    last_review == np.iinfo(np.int64).min,
+                    -1,
+                    (now_ns - last_review) // 86_400_000_000_000
+                )
+                df_features['review_recency'] = days.astype(np.int32)
         
         if 'is_superhost' in features_to_create:
             if 'host_name' in df_features.columns and 'number_of_reviews' in df_features.columns:
                 # Simple heuristic for superhost (could be enhanced)
-                df_features['is_superhost'] = (
-                    (df_features['number_of_reviews'] > 50) &
-                    (df_features['calculated_host_listings_count'] <= 3)
-                )
+                reviews = df_features['number_of_reviews'].to_numpy(dtype=np.float64, na_value=np.nan)
+                listings = df_features['calculated_host_listings_count'].to_numpy(dtype=np.float64, na_value=np.nan)
+                df_features['is_superhost'] = np.logical_and(reviews > 50, listings <= 3)
         
         logger.info(f"Feature engineering complete. New columns: {list(df_features.columns)}")
         return df_features
@@ -1,13 +1,76 @@
 """
 Utility functions for ETL pipeline
 """
-import yaml
+import copy
+import mmap
+import os
+import numpy as np
+import pandas as pd
 from pathlib import Path
-from typing import Dict, Any
-import logging
-from loguru import logger
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Set, Union
 import sys
 
+# PyYAML and its loader/dumper, imported on first use by _get_yaml()
+_yaml = None
+_Loader = None
+_Dumper = None
+
+# Configs larger than this are parsed from a memory map
+_MMAP_MIN_SIZE = 8 * 1024
+
+# Parsed configs keyed by (absolute path, mtime_ns, size)
+_CFG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Shared generator for get_sample_data
+_RNG = np.random.default_rng()
+
+# Directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+_DEFAULT_LOG_FORMAT = '{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}'
+
+# Logging settings applied by the last setup_logging() call
+_APPLIED_LOGGING_KEY = None
+
+# Used when the config file doesn't exist; read-only so it can't be
+# mutated through a returned config (load_config hands out plain copies)
+_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
+    'paths': MappingProxyType({
+        'raw_data': 'data/raw/',
+        'processed_data': 'data/processed/',
+        'logs': 'logs/'
+    })
+})
+
+def _get_yaml():
+    """Import PyYAML once, preferring the libyaml-backed C loader/dumper"""
+    global _yaml, _Loader, _Dumper
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+        except ImportError:  # pragma: no cover - libyaml not available
+            from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+        _yaml = yaml
+    return _yaml
+
+def _to_plain(value: Any) -> Any:
+    """Recursively convert mappings (e.g. MappingProxyType) to plain dicts"""
+    if isinstance(value, Mapping):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    return value
+
+def _ensure_dir(path: Union[str, Path]) -> None:
+    """Create a directory (and parents) at most once per process"""
+    key = os.fspath(path)
+    if key in _ENSURED_DIRS:
+        return
+    os.makedirs(key, exist_ok=True)
+    _ENSURED_DIRS.add(key)
+
 def setup_logging(config: Dict[str, Any]) -> None:
     """
     Configure logging for the pipeline
@@ -15,34 +78,62 @@ def setup_logging(config: Dict[str, Any]) -> None:
     Args:
         config: Configuration dictionary
     """
+    global _APPLIED_LOGGING_KEY
+    from loguru import logger
+    
     log_config = config.get('logging', {})
     
+    # Same settings as the last call: keep the existing sinks
+    key = (
+        log_config.get('level'),
+        log_config.get('format'),
+        os.fspath(config['paths']['logs']),
+        log_config.get('rotation'),
+        log_config.get('retention')
+    )
+    if key == _APPLIED_LOGGING_KEY:
+        return
+    
+    # Resolved once and shared by both sinks; loguru compiles a format
+    # string when the sink is added, so records aren't re-parsed
+    log_level = log_config.get('level', 'INFO')
+    log_format = log_config.get('format', _DEFAULT_LOG_FORMAT)
+    
     # Remove default handler
     logger.remove()
     
     # Add console handler
     logger.add(
         sys.stdout,
-        level=log_config.get('level', 'INFO'),
-        format=log_config.get('format', '{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}')
+        level=log_level,
+        format=log_format
     )
     
-    # Add file handler
-    log_path = Path(config['paths']['logs'])
-    log_path.mkdir(exist_ok=True)
+    # Add file handler; plain absolute str paths for os and loguru
+    logs_dir = os.fspath(Path(config['paths']['logs']).resolve())
+    _ensure_dir(logs_dir)
+    log_file = os.path.join(logs_dir, "etl_pipeline.log")
     
+    # Records are queued and written by a background worker through a
+    # 64 KiB file buffer, so log calls don't wait on small writes
     logger.add(
-        log_path / "etl_pipeline.log",
-        level=log_config.get('level', 'INFO'),
-        format=log_config.get('format', '{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}'),
+        log_file,
+        level=log_level,
+        format=log_format,
         rotation=log_config.get('rotation', '10 MB'),
-        retention=log_config.get('retention', '30 days')
+        retention=log_config.get('retention', '30 days'),
+        enqueue=True,
+        buffering=65536,
+        catch=False
     )
+    _APPLIED_LOGGING_KEY = key
 
 def load_config(config_path: Union[str, Path] = "config.yaml") -> Dict[str, Any]:
     """
     Load configuration from YAML file
     
+    When the file doesn't exist a copy of the default config is returned.
+    
     Args:
         config_path: Path to config file
         
@@ -51,21 +142,35 @@ def load_config(config_path: Union[str, Path] = "config.yaml") -> Dict[str, Any]
     """
     config_path = Path(config_path)
     
-    if not config_path.exists():
-        # Create default config if doesn't exist
-        default_config = {
-            'paths': {
-                'raw_data': 'data/raw/',
-                'processed_data': 'data/processed/',
-                'logs': 'logs/'
-            }
-        }
-        return default_config
+    # A single open doubles as the existence check; binary mode lets
+    # libyaml decode the bytes itself
+    try:
+        f = open(config_path, 'rb')
+    except FileNotFoundError:
+        return _to_plain(_DEFAULT_CONFIG)
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    with f:
+        # Reuse the parsed dict while the file is unchanged; callers get a
+        # deep copy so mutating it cannot leak into later calls
+        st = os.fstat(f.fileno())
+        path = os.path.abspath(config_path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key not in _CFG_CACHE:
+            _forget_config(path)
+            yaml = _get_yaml()
+            if st.st_size > _MMAP_MIN_SIZE:
+                # Let libyaml scan large files straight from the page cache
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    _CFG_CACHE[key] = yaml.load(mm, Loader=_Loader)
+            else:
+                _CFG_CACHE[key] = yaml.load(f, Loader=_Loader)
     
-    return config
+    return copy.deepcopy(_CFG_CACHE[key])
+
+def _forget_config(path: str) -> None:
+    """Drop cached entries for a config file"""
+    for key in [k for k in _CFG_CACHE if k[0] == path]:
+        del _CFG_CACHE[key]
 
 def save_config(config: Dict[str, Any], config_path: Union[str, Path] = "config.yaml") -> None:
     """
@@ -76,10 +181,12 @@ def save_config(config: Dict[str, Any], config_path: Union[str, Path] = "config.
         config_path: Path to config file
     """
     config_path = Path(config_path)
-    config_path.parent.mkdir(exist_ok=True)
+    _ensure_dir(config_path.parent)
     
     with open(config_path, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+        # SafeDumper only represents plain dicts, not other Mapping types
+        _get_yaml().dump(_to_plain(config), f, Dumper=_Dumper, default_flow_style=False)
+    _forget_config(os.path.abspath(config_path))
 
 def get_sample_data(df: pd.DataFrame, n: int = 5) -> pd.DataFrame:
     """
@@ -92,17 +199,40 @@ def get_sample_data(df: pd.DataFrame, n: int = 5) -> pd.DataFrame:
     Returns:
         Sampled DataFrame
     """
-    return df.sample(min(n, len(df)))
+    k = min(n, len(df))
+    if k == len(df):
+        return df
+    # Positional take skips the index handling of DataFrame.sample
+    idx = _RNG.choice(len(df), size=k, replace=False)
+    return df.take(idx)
 
-def memory_usage(df: pd.DataFrame) -> str:
+def memory_usage(df: pd.DataFrame, exact: bool = False) -> str:
     """
     Calculate memory usage of DataFrame
     
+    Typed columns are measured exactly; the contents of Python-object
+    columns are extrapolated from a sample of at most 1024 values
+    unless exact is set.
+    
     Args:
         df: DataFrame to analyze
+        exact: Measure every Python object (slow on large frames)
         
     Returns:
         Formatted memory usage string
     """
-    memory_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+    if exact:
+        memory_bytes = df.memory_usage(deep=True).sum()
+    else:
+        # Shallow usage is exact for typed buffers and counts the
+        # pointers of object columns; add their estimated payload
+        memory_bytes = df.memory_usage(deep=False).sum()
+        for i, dtype in enumerate(df.dtypes):
+            if dtype == object or getattr(dtype, 'storage', None) == 'python':
+                values = df.iloc[:, i].to_numpy(dtype=object)
+                if len(values):
+                    sample = values[::max(1, len(values) // 1024)]
+                    memory_bytes += len(values) * sum(map(sys.getsizeof, sample)) / len(sample)
+    
+    memory_mb = memory_bytes / 1024 ** 2
     return f"{memory_mb:.2f} MB"
@@ -4,11 +4,11 @@ Tests for extraction module
 import pytest
 import pandas as pd
 from pathlib import Path
-import tempfile
+import os
 import zipfile
 from src.extract import DataExtractor
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_config():
     return {
         'paths': {
@@ -20,7 +20,13 @@ def sample_config():
         }
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def extractor(sample_config):
+    # Shared by tests that use the unmodified config; the extractor keeps
+    # no per-read state, so reuse is safe
+    return DataExtractor(sample_config)
+
+@pytest.fixture(scope="session")
 def sample_csv_data():
     return pd.DataFrame({
         'id': [1, 2, 3],
@@ -28,46 +34,201 @@ def sample_csv_data():
         'price': [100, 200, 150]
     })
 
-def test_extractor_initialization(sample_config):
-    extractor = DataExtractor(sample_config)
+@pytest.fixture(scope="session")
+def csv_path(tmp_path_factory, sample_csv_data):
+    # Written once per session; tests must only read it
+    path = tmp_path_factory.mktemp("data") / "sample.csv"
+    with open(path, 'wb', buffering=1 << 20) as f:
+        sample_csv_data.to_csv(f, index=False, lineterminator='\n')
+    return path
+
+@pytest.fixture(scope="session")
+def zip_path(tmp_path_factory, csv_path):
+    path = tmp_path_factory.mktemp("data") / "sample.zip"
+    # Stored, not deflated: the sample is tiny
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED) as zipf:
+        zipf.write(csv_path, 'airbnb_data.csv')
+    return path
+
+def test_extractor_initialization(extractor, sample_config):
     assert extractor.config == sample_config
     assert Path('test_raw_data').exists()
 
-def test_extract_from_csv(sample_config, sample_csv_data):
-    # Create temporary CSV file
-    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
-        sample_csv_data.to_csv(f.name, index=False)
-        temp_path = f.name
-    
-    try:
-        extractor = DataExtractor(sample_config)
-        df = extractor.extract_from_csv(temp_path)
-        
-        assert len(df) == 3
-        assert list(df.columns) == ['id', 'name', 'price']
-        assert df['price'].sum() == 450
-    finally:
-        Path(temp_path).unlink()
-
-def test_extract_from_zip(sample_config, sample_csv_data):
-    # Create temporary ZIP with CSV
-    with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as zip_file:
-        temp_zip = zip_file.name
-    
-    try:
-        # Create ZIP file
-        with zipfile.ZipFile(temp_zip, 'w') as zipf:
-            with tempfile.NamedTemporaryFile(suffix='.csv', delete=False, mode='w') as csv_file:
-                sample_csv_data.to_csv(csv_file.name, index=False)
-                zipf.write(csv_file.name, 'airbnb_data.csv')
-                Path(csv_file.name).unlink()
-        
-        extractor = DataExtractor(sample_config)
-        df = extractor.extract_from_zip(temp_zip)
-        
-        assert len(df) == 3
-        assert 'id' in df.columns
-        assert 'price' in df.columns
-        
-    finally:
-        Path(temp_zip).unlink()
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_extract_from_csv(extractor, sample_csv_data, csv_path, engine):
+    df = extractor.extract_from_csv(csv_path, engine=engine)
+    
+    assert len(df) == 3
+    assert list(df.columns) == ['id', 'name', 'price']
+    assert df['price'].sum() == 450
+    pd.testing.assert_frame_equal(df, sample_csv_data, check_dtype=False)
+
+def test_extract_from_csv_arrow_writable(sample_config, csv_path):
+    config = {**sample_config, 'extraction': {**sample_config['extraction'], 'use_arrow': True}}
+    
+    df = DataExtractor(config).extract_from_csv(csv_path)
+    df.loc[1, 'price'] = 250
+    df.loc[0, 'name'] = 'Renamed'
+    
+    assert df['price'].sum() == 500
+    assert df.loc[0, 'name'] == 'Renamed'
+
+def test_extract_from_zip(extractor, zip_path):
+    df = extractor.extract_from_zip(zip_path)
+    
+    assert len(df) == 3
+    assert 'id' in df.columns
+    assert 'price' in df.columns
+    
+    # Same result as streaming the member straight into pandas
+    with zipfile.ZipFile(zip_path) as zipf, zipf.open('airbnb_data.csv') as fh:
+        pd.testing.assert_frame_equal(df, pd.read_csv(fh))
+
+def test_extract_from_csv_arrow(sample_config, csv_path):
+    config = {**sample_config, 'extraction': {**sample_config['extraction'], 'use_arrow': True}}
+    
+    extractor = DataExtractor(config)
+    df = extractor.extract_from_csv(csv_path)
+    
+    assert len(df) == 3
+    assert list(df.columns) == ['id', 'name', 'price']
+    assert df['price'].sum() == 450
+
+def test_extract_from_zip_to_disk(sample_config, sample_csv_data, tmp_path):
+    config = {**sample_config, 'extraction': {**sample_config['extraction'], 'stream': False}}
+    
+    zip_path = tmp_path / 'sample.zip'
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zipf:
+        zipf.writestr('airbnb_data.csv', sample_csv_data.to_csv(index=False))
+    
+    extractor = DataExtractor(config)
+    df = extractor.extract_from_zip(zip_path)
+    
+    assert len(df) == 3
+    assert (Path('test_raw_data') / 'airbnb_data.csv').exists()
+
+def test_extract_all_from_zip(extractor, sample_csv_data, tmp_path):
+    zip_path = tmp_path / 'sample.zip'
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zipf:
+        zipf.writestr('listings.csv', sample_csv_data.to_csv(index=False))
+        zipf.writestr('reviews.csv', sample_csv_data.head(2).to_csv(index=False))
+        zipf.writestr('empty.csv', '')
+    
+    frames = extractor.extract_all_from_zip(zip_path)
+    
+    assert set(frames) == {'listings.csv', 'reviews.csv'}
+    assert len(frames['listings.csv']) == 3
+    assert len(frames['reviews.csv']) == 2
+
+@pytest.mark.parametrize("use_arrow", [False, True])
+def test_extract_from_csv_schema_cache(sample_config, sample_csv_data, tmp_path, use_arrow):
+    config = {
+        **sample_config,
+        'extraction': {
+            **sample_config['extraction'],
+            'use_arrow': use_arrow,
+            'schema_dir': str(tmp_path / 'schemas')
+        }
+    }
+    csv_path = tmp_path / 'sample.csv'
+    sample_csv_data.to_csv(csv_path, index=False)
+    
+    extractor = DataExtractor(config)
+    first = extractor.extract_from_csv(csv_path)
+    schema = extractor._load_schema('sample.csv', extractor._source_version(csv_path))
+    assert schema == first.dtypes.astype(str).to_dict()
+    
+    second = extractor.extract_from_csv(csv_path)
+    pd.testing.assert_frame_equal(first, second)
+
+@pytest.mark.parametrize("use_arrow", [False, True])
+def test_extract_schema_cache_invalidation(sample_config, sample_csv_data, tmp_path, use_arrow):
+    config = {
+        **sample_config,
+        'extraction': {
+            **sample_config['extraction'],
+            'use_arrow': use_arrow,
+            'schema_dir': str(tmp_path / 'schemas')
+        }
+    }
+    csv_path = tmp_path / 'listings.csv'
+    sample_csv_data.to_csv(csv_path, index=False)
+    
+    extractor = DataExtractor(config)
+    extractor.extract_from_csv(csv_path)
+    
+    # A new release under the same name with a blank in a column cached as int64
+    new_release = 'id,name,price\n1,Listing 1,\n2,Listing 2,200\n'
+    csv_path.write_text(new_release)
+    version = extractor._source_version(csv_path)
+    assert extractor._load_schema('listings.csv', version) is None
+    assert extractor.extract_from_csv(csv_path)['price'].isna().sum() == 1
+    
+    # A schema that no longer parses falls back to inference and is rewritten
+    csv_path.write_text('id,name,price\n1,Listing 1,$100\n2,Listing 2,$200\n')
+    version = extractor._source_version(csv_path)
+    extractor._save_schema('listings.csv', version, sample_csv_data)
+    assert extractor.extract_from_csv(csv_path)['price'].tolist() == ['$100', '$200']
+    assert extractor._load_schema('listings.csv', version)['price'] != 'int64'
+    
+    # Same for an in-memory ZIP member, which has to be re-read from the start
+    zip_path = tmp_path / 'listings.zip'
+    with zipfile.ZipFile(zip_path, 'w') as zipf:
+        zipf.write(csv_path, 'listings.csv')
+    info = zipfile.ZipFile(zip_path).getinfo('listings.csv')
+    extractor._save_schema('listings.csv', f"{info.file_size}-{info.CRC:08x}", sample_csv_data)
+    assert extractor.extract_from_zip(zip_path)['price'].tolist() == ['$100', '$200']
+
+@pytest.mark.parametrize("mmap_threshold", [0, 512 * 1024 ** 2])
+def test_extract_from_zip_streamed(sample_config, sample_csv_data, zip_path, mmap_threshold):
+    config = {
+        **sample_config,
+        'extraction': {**sample_config['extraction'], 'mmap_threshold': mmap_threshold}
+    }
+    extractor = DataExtractor(config)
+    df = extractor.extract_from_zip(zip_path)
+    
+    pd.testing.assert_frame_equal(df, sample_csv_data, check_dtype=False)
+
+def test_zip_handles_are_closed(extractor, sample_csv_data, tmp_path):
+    zip_path = tmp_path / 'sample.zip'
+    with zipfile.ZipFile(zip_path, 'w') as zipf:
+        zipf.writestr('listings.csv', sample_csv_data.to_csv(index=False))
+    
+    first = extractor._open_zip(zip_path)
+    assert extractor._open_zip(zip_path) is first
+    
+    # A rewritten archive gets a new handle and the stale one is closed
+    with zipfile.ZipFile(zip_path, 'w') as zipf:
+        zipf.writestr('listings.csv', sample_csv_data.to_csv(index=False))
+    os.utime(zip_path, ns=(0, os.stat(zip_path).st_mtime_ns + 1))
+    second = extractor._open_zip(zip_path)
+    assert second is not first
+    assert first.fp is None
+    
+    DataExtractor.close_zip_handles()
+    assert second.fp is None
+    assert not DataExtractor._zip_handles
+
+def test_extract_table(extractor, csv_path):
+    table = extractor.extract_table(csv_path)
+    
+    assert table.num_rows == 3
+    assert table.column_names == ['id', 'name', 'price']
+    pd.testing.assert_frame_equal(table.to_pandas(), extractor.extract(csv_path), check_dtype=False)
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_extract_columnar(extractor, sample_csv_data, tmp_path, fmt):
+    path = tmp_path / f"sample.{fmt}"
+    getattr(sample_csv_data, f"to_{fmt}")(path)
+    
+    df = extractor.extract(path)
+    
+    pd.testing.assert_frame_equal(df, sample_csv_data)
+    assert extractor.extract_table(path).num_rows == 3
+
+def test_extract_unsupported_type(extractor, tmp_path):
+    with pytest.raises(ValueError):
+        extractor.extract(tmp_path / 'sample.txt')
+    with pytest.raises(ValueError):
+        extractor.extract(tmp_path / 'sample.csv', source_type='xml')
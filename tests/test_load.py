@@ -0,0 +1,41 @@
+"""
+Tests for loading module
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from src.load import DataLoader
+
+@pytest.fixture
+def sample_config(tmp_path):
+    return {
+        'paths': {
+            'processed_data': str(tmp_path / 'processed')
+        },
+        'quality_checks': {
+            'enabled': True
+        }
+    }
+
+def test_quality_counts_numba_matches_pandas(sample_config):
+    pytest.importorskip('numba')
+    
+    df = pd.DataFrame({
+        'id': [1, np.nan, 3, np.nan],
+        'price': [100.0, -5.0, np.nan, -1.0],
+        'last_review': pd.to_datetime(['2019-01-01', '2999-01-01', None, '2998-06-01']),
+        'host_since': pd.to_datetime(['2015-01-01', None, '2016-01-01', '2017-01-01'])
+    })
+    date_cols = ['last_review', 'host_since']
+    now = pd.Timestamp('2024-01-01')
+    
+    loader = DataLoader(sample_config)
+    kernel = loader._quality_counts_numba(df, date_cols, now)
+    
+    # Below the row threshold the pandas counters are used
+    expected = loader._quality_counts(df, date_cols, now)
+    
+    assert kernel['null_ids'] == expected['null_ids'] == 2
+    assert kernel['negative_prices'] == expected['negative_prices'] == 2
+    pd.testing.assert_series_equal(kernel['future_dates'], expected['future_dates'], check_dtype=False)
+    assert expected['future_dates'].tolist() == [2, 0]
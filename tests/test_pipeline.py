@@ -0,0 +1,51 @@
+"""
+Tests for pipeline module
+"""
+import pytest
+import pandas as pd
+import zipfile
+from src.pipeline import NYC_Airbnb_ETL
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+@pytest.fixture(scope="module")
+def zip_path(tmp_path_factory):
+    rows = 30
+    df = pd.DataFrame({
+        'id': range(1, rows + 1),
+        'name': [f'Listing {i}' for i in range(rows)],
+        'host_id': range(1000, 1000 + rows),
+        'host_name': ['Host'] * rows,
+        'neighbourhood_group': ['Brooklyn', 'Manhattan', 'Queens'] * (rows // 3),
+        'neighbourhood': ['Kensington', 'Midtown', 'Astoria'] * (rows // 3),
+        'latitude': [40.6] * rows,
+        'longitude': [-73.9] * rows,
+        'room_type': ['Private room', 'Entire home/apt'] * (rows // 2),
+        'price': [f'${50 + i}' for i in range(rows)],
+        'minimum_nights': [1, 2, 3] * (rows // 3),
+        'number_of_reviews': range(rows),
+        'last_review': ['2019-05-21', ''] * (rows // 2),
+        'reviews_per_month': [0.5, None] * (rows // 2),
+        'calculated_host_listings_count': [1] * rows,
+        'availability_365': [0, 365, 100] * (rows // 3)
+    })
+    path = tmp_path_factory.mktemp("data") / "listings.zip"
+    with zipfile.ZipFile(path, 'w') as zipf:
+        zipf.writestr('AB_NYC_2019.csv', df.to_csv(index=False))
+    return path
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_chunked_matches_run(zip_path, tmp_path, workers):
+    pipeline = NYC_Airbnb_ETL()
+    pipeline.run(zip_path, tmp_path / 'full')
+    full_path = next((tmp_path / 'full').glob('*.parquet'))
+    chunked_path = pipeline.run(zip_path, tmp_path / 'chunked', chunksize=7, workers=workers)
+
+    # Same Parquet schema whichever reader and mode produced the file
+    full_schema = pq.read_schema(full_path).remove_metadata()
+    assert pq.read_schema(chunked_path).remove_metadata() == full_schema
+
+    # Category order follows the reader (Arrow: first seen, pandas: sorted)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(chunked_path), pd.read_parquet(full_path), check_categorical=False
+    )
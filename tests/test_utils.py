@@ -0,0 +1,17 @@
+"""
+Tests for utility module
+"""
+import copy
+from src.utils import load_config, save_config
+
+def test_default_config_round_trip(tmp_path):
+    config = load_config(tmp_path / 'missing.yaml')
+    assert config['paths']['logs'] == 'logs/'
+    
+    # A plain, independent dict like the one returned for an existing file
+    config['paths']['logs'] = 'other/'
+    assert copy.deepcopy(config) == config
+    assert load_config(tmp_path / 'missing.yaml')['paths']['logs'] == 'logs/'
+    
+    save_config(config, tmp_path / 'config.yaml')
+    assert load_config(tmp_path / 'config.yaml') == config